@@ -0,0 +1,383 @@
+import time
+import argparse
+import threading
+import RPi.GPIO as GPIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from networkii.services.network_monitor import NetworkMonitor
+from networkii.services.display import Display
+from networkii.services.screen_manager import ScreenManager
+from networkii.screens import HomeScreen, SetupScreen, NoInternetScreen, BasicStatsScreen, DetailedStatsScreen
+from networkii.utils.cache import TTLCached
+from networkii.utils.logger import get_logger
+from networkii.utils.network import check_connection, has_ipv4, has_wifi_saved, monitor_device, start_ap
+from networkii.config import (WIFI_CHECK_INTERVAL, INTERNET_CHECK_INTERVAL, REDRAW_INTERVAL, FORCE_REDRAW_INTERVAL,
+                              BAD_RESPONSES_THRESHOLD, GOOD_RESPONSES_THRESHOLD, NETWORK_CHANGED_DELAY,
+                              BUTTON_BOUNCE_TIME)
+
+logger = get_logger('main')
+
+_monotonic_ns = time.monotonic_ns
+
+# App modes dispatched by NetworkiiApp.run
+MODE_MONITOR = 'monitor'
+MODE_SETUP = 'setup'
+
+class NetworkiiApp:
+    __slots__ = ('display', 'screen_manager', 'button_map', 'last_press_time', 'debounce_ns',
+                 '_redraw_event', '_wifi_changed', '_screen_button', 'network_monitor',
+                 'monitor_thread', '_stop_event', 'latest_stats', '_wifi_ok', '_net_ok', 'probe_thread',
+                 'wifi_connected', 'internet_connected', '_probe_pool')
+
+    def __init__(self):
+        self.display = Display()
+        self.screen_manager = ScreenManager()
+        
+        # Initialize all screens
+        self.screen_manager.add_screen('home', HomeScreen(self.display))
+        self.screen_manager.add_screen('basic_stats', BasicStatsScreen(self.display))
+        self.screen_manager.add_screen('detailed_stats', DetailedStatsScreen(self.display))
+        
+        # Setup screens
+        self.screen_manager.add_screen('setup', SetupScreen(self.display))
+        self.screen_manager.add_screen('no_internet', NoInternetScreen(self.display))
+        
+        # Map button pins to labels (pin attributes are resolved once here, not per press)
+        disp = self.display.disp
+        self.button_map = {
+            disp.BUTTON_A: 'A',
+            disp.BUTTON_B: 'B',
+            disp.BUTTON_X: 'X',
+            disp.BUTTON_Y: 'Y'
+        }
+        self._screen_button = self.screen_manager.handle_button
+        
+        # Button debouncing (time.monotonic_ns integers, immune to NTP/RTC clock jumps)
+        self.last_press_time = 0
+        self.debounce_ns = 500_000_000  # 0.5 seconds
+        
+        # Set by button presses, new stats and connection changes to wake the display loop
+        self._redraw_event = threading.Event()
+        
+        # Set when NetworkManager reports a wlan0 state change during setup mode
+        self._wifi_changed = threading.Event()
+        
+        self.network_monitor = None
+        self.monitor_thread = None
+        self.probe_thread = None
+        self._stop_event = threading.Event()  # Set to stop the monitor and probe threads
+        self.latest_stats = None
+        
+        # Latest connection state, published by the probe thread
+        self.wifi_connected = True
+        self.internet_connected = True
+        
+        # wlan0 and usb0 are pinged side by side, so a timing-out interface doesn't delay the other
+        self._probe_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='probe')
+        
+        # Connection probes only re-run once their cached result goes stale
+        self._wifi_ok = TTLCached(self._probe_wifi, WIFI_CHECK_INTERVAL)
+        self._net_ok = TTLCached(self._probe_internet, INTERNET_CHECK_INTERVAL)
+        
+        # Setup button handlers last, once handle_button's state exists. Press edges only
+        # (buttons are active low, set up as pulled-up inputs by DisplayHATMini), with
+        # contact bounce filtered by the GPIO library before it reaches Python.
+        for pin in self.button_map:
+            GPIO.add_event_detect(pin, GPIO.FALLING, callback=self.handle_button, bouncetime=BUTTON_BOUNCE_TIME)
+    
+    def handle_button(self, pin):
+        """
+        Single callback for any button press on Display HAT Mini.
+        Maps the pin to a button label and delegates to the screen manager.
+        Includes debouncing to prevent double clicks.
+        """
+        try:
+            # Bounce is filtered before the callback; this drops double presses
+            current_time = _monotonic_ns()
+            if current_time - self.last_press_time < self.debounce_ns:
+                logger.debug("Button edge ignored (debounce)")
+                return
+
+            button_label = self.button_map.get(pin)
+            if button_label is None:
+                logger.warning("Unknown button pin %s", pin)
+                return
+
+            self.last_press_time = current_time
+
+            self._screen_button(button_label)
+            self._redraw_event.set()
+            
+        except Exception as e:
+            logger.error(f"Error handling button press: {e}")
+
+    def _invalidate_probes(self):
+        """Force the next connection checks to probe again"""
+        self._wifi_ok.invalidate()
+        self._net_ok.invalidate()
+
+    @staticmethod
+    def _probe_wifi():
+        return has_wifi_saved('wlan0')
+
+    def _probe_internet(self):
+        # usb0 is usually absent or unaddressed, so only ping interfaces that could answer
+        interfaces = [interface for interface in ('wlan0', 'usb0') if has_ipv4(interface)]
+        if len(interfaces) < 2:
+            return any(check_connection(interface) for interface in interfaces)
+        probes = [self._probe_pool.submit(check_connection, interface) for interface in interfaces]
+        # Return on the first success rather than waiting for the other ping to time out
+        return any(probe.result() for probe in as_completed(probes))
+
+    def network_monitor_loop(self):
+        """Background thread for network monitoring, publishing each stats snapshot by plain attribute assignment"""
+        logger.debug("Network monitor thread started")
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            try:
+                self.latest_stats = self.network_monitor.get_stats()
+                self._redraw_event.set()  # Wake the display loop to draw the new snapshot
+                stop_event.wait(2)  # Get new stats every 2 seconds, returning at once on shutdown
+            except Exception as e:
+                logger.error("Error in monitor thread: %s", e)
+                stop_event.wait(1)  # Wait before retrying on error
+
+    def connection_probe_loop(self):
+        """Background thread for WiFi/internet probes so the display loop never blocks on them"""
+        logger.debug("Connection probe thread started")
+        # Internet state only flips after a streak of agreeing probes, so brief loss doesn't thrash screens
+        fail_streak = 0
+        ok_streak = 0
+        last_change = time.monotonic()
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            try:
+                if self._wifi_changed.is_set():
+                    # NetworkManager reported a wlan0 change, so cached results may already be wrong
+                    self._wifi_changed.clear()
+                    self._invalidate_probes()
+                wifi_connected = self._wifi_ok()
+                probe_ok = wifi_connected and self._net_ok()
+                if probe_ok:
+                    ok_streak += 1
+                    fail_streak = 0
+                else:
+                    fail_streak += 1
+                    ok_streak = 0
+                
+                internet_connected = self.internet_connected
+                if probe_ok != internet_connected:
+                    self._net_ok.invalidate()  # Confirm with fresh probes rather than waiting out the cache
+                    if time.monotonic() - last_change >= NETWORK_CHANGED_DELAY:
+                        if internet_connected and fail_streak >= BAD_RESPONSES_THRESHOLD:
+                            internet_connected = False
+                        elif not internet_connected and ok_streak >= GOOD_RESPONSES_THRESHOLD:
+                            internet_connected = True
+                
+                if (wifi_connected, internet_connected) != (self.wifi_connected, self.internet_connected):
+                    if internet_connected != self.internet_connected:
+                        last_change = time.monotonic()
+                    self.wifi_connected = wifi_connected
+                    self.internet_connected = internet_connected
+                    self._redraw_event.set()  # Let the display loop react right away
+                stop_event.wait(1)  # Cached probes only re-run once their interval expires
+            except Exception as e:
+                logger.error("Error in probe thread: %s", e)
+                stop_event.wait(1)  # Wait before retrying on error
+
+    def device_watch_loop(self, watcher):
+        """Background thread turning `nmcli device monitor` output into wakeups for the current mode"""
+        logger.debug("Device watch thread started")
+        for line in watcher.stdout:
+            logger.debug("wlan0 state change: %s", line.strip())
+            self._wifi_changed.set()
+            self._redraw_event.set()
+        logger.debug("Device watch thread stopped")
+
+    def _start_device_watch(self):
+        """Watch wlan0 for NetworkManager state changes. Returns the watcher process, or None"""
+        self._wifi_changed.clear()
+        watcher = monitor_device('wlan0')
+        if watcher:
+            threading.Thread(target=self.device_watch_loop, args=(watcher,), daemon=True).start()
+        return watcher
+
+    @staticmethod
+    def _stop_device_watch(watcher):
+        """Stop a watcher from _start_device_watch"""
+        if watcher:
+            watcher.terminate()  # Closes its stdout, ending the device watch thread
+            watcher.wait()
+
+    def _stop_threads(self):
+        """Stop the monitor and probe threads and wait for them to exit"""
+        self._stop_event.set()  # Wakes both threads out of their waits straight away
+        for thread in (self.monitor_thread, self.probe_thread):
+            if thread:
+                # Not bounded by a timeout: the next session reuses the NetworkMonitor, so a
+                # thread still finishing its ping must be gone before new threads start
+                thread.join()
+        self.monitor_thread = None
+        self.probe_thread = None
+
+    def run_monitor_mode(self):
+        """Run the main monitoring interface. Returns the next mode, or None to exit"""
+        logger.info("Starting monitor mode")
+        # One monitor for the app's lifetime, reset for each monitor session
+        if self.network_monitor is None:
+            self.network_monitor = NetworkMonitor()
+        else:
+            self.network_monitor.reset()
+        
+        # Assume connected until the first probe says otherwise, as we only get here with WiFi saved
+        self.wifi_connected = True
+        self.internet_connected = True
+        
+        # Probes re-run as soon as NetworkManager reports a wlan0 change; their TTLs are the fallback
+        watcher = self._start_device_watch()
+        
+        # Start monitor and probe threads
+        self._stop_event.clear()
+        self.monitor_thread = threading.Thread(target=self.network_monitor_loop)
+        self.monitor_thread.daemon = True
+        self.monitor_thread.start()
+        self.probe_thread = threading.Thread(target=self.connection_probe_loop)
+        self.probe_thread.daemon = True
+        self.probe_thread.start()
+        
+        # Track if we're in internet mode or no-internet mode
+        in_internet_mode = True
+        
+        # What was last pushed to the display, to skip identical redraws
+        drawn_screen = None
+        drawn_stats = None
+        drawn_at = 0.0
+        
+        # Bound once, outside the loop
+        screen_manager = self.screen_manager
+        draw_screen = screen_manager.draw_screen
+        redraw_event = self._redraw_event
+        monotonic = time.monotonic
+        
+        try:
+            while True:
+                # First check if we have WiFi connection
+                if not self.wifi_connected:
+                    logger.info("No WiFi connection, switching to setup mode")
+                    return MODE_SETUP
+                
+                # Check if we have internet on preferred interface
+                has_internet = self.internet_connected
+                
+                # Handle mode transitions only when status changes
+                if has_internet and not in_internet_mode:
+                    logger.info("Internet connection restored")
+                    in_internet_mode = True
+                    screen_manager.switch_screen('home')  # Return to home screen when internet is restored
+                elif not has_internet and in_internet_mode:
+                    logger.info("Internet connection lost")
+                    in_internet_mode = False
+                    screen_manager.switch_screen('no_internet')  # Show no internet screen
+                
+                # Update current screen with latest stats, only when something changed
+                screen = screen_manager.current_screen
+                stats = self.latest_stats if has_internet else None  # No stats needed for no internet screen
+                now = monotonic()
+                stale = now - drawn_at >= FORCE_REDRAW_INTERVAL  # Refresh relative times like "Updated 3m ago"
+                if stale or screen != drawn_screen or stats != drawn_stats:
+                    if stats is not None or not has_internet:
+                        draw_screen(stats)
+                        drawn_screen, drawn_stats, drawn_at = screen, stats, now
+                
+                # Sleep until there is something new to draw; the timeout only covers forced refreshes
+                redraw_event.wait(FORCE_REDRAW_INTERVAL)
+                redraw_event.clear()
+                
+        except KeyboardInterrupt:
+            logger.info("Program terminated by user")
+        except Exception as e:
+            logger.error(f"Error in monitor mode: {e}")
+        finally:
+            self._stop_threads()
+            self._stop_device_watch(watcher)
+            # Don't show this session's stats when monitor mode is next entered
+            self.latest_stats = None
+
+    def no_wifi_mode(self):
+        """ No WiFi mode - show no connection screen. Returns the next mode, or None to exit """
+        logger.info("No WiFi connection, starting AP and showing setup screen")
+        
+        # Clean up existing mode first
+        self._stop_threads()
+        
+        # Start AP mode and show setup screen
+        start_ap()
+        self.screen_manager.switch_screen('setup')
+        
+        # Check for saved WiFi when NetworkManager reports a change, polling only as a fallback
+        watcher = self._start_device_watch()
+        last_check = None
+        
+        try:
+            while True:
+                # Keep updating the screen
+                self.screen_manager.draw_screen(None)
+                
+                # Check if WiFi is now configured
+                now = time.monotonic()
+                watching = watcher is not None and watcher.poll() is None
+                if (not watching or self._wifi_changed.is_set() or last_check is None
+                        or now - last_check >= WIFI_CHECK_INTERVAL):
+                    self._wifi_changed.clear()
+                    last_check = now
+                    if has_wifi_saved('wlan0'):
+                        logger.info("WiFi configured, switching to monitor mode")
+                        self._invalidate_probes()  # Don't carry results over from the previous monitor session
+                        self.screen_manager.switch_screen('home')  # Switch to home screen before monitor mode
+                        return MODE_MONITOR
+                
+                # The setup screen only changes once a second; wake early on button presses and WiFi changes
+                self._redraw_event.wait(REDRAW_INTERVAL)
+                self._redraw_event.clear()
+                
+        except KeyboardInterrupt:
+            logger.info("Program terminated by user")
+        except Exception as e:
+            logger.error(f"Error in no_wifi mode: {e}")
+            raise  # Re-raise to be handled by main error handler
+        finally:
+            self._stop_device_watch(watcher)
+
+    def run(self, setup_mode=False):
+        """Main entry point for the application"""
+        logger.debug("Networkii starting up...")
+        
+        try:
+            # Each mode returns the next one, so switching never grows the call stack
+            mode = MODE_SETUP if setup_mode or not has_wifi_saved('wlan0') else MODE_MONITOR
+            while mode is not None:
+                if mode == MODE_SETUP:
+                    mode = self.no_wifi_mode()
+                else:
+                    mode = self.run_monitor_mode()
+        except Exception as e:
+            logger.error(f"Error in main loop: {e}")
+        finally:
+            # Ensure proper cleanup
+            self._stop_threads()
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
+
+def main():
+    logger.info("============ Starting Networkii =============")
+    
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Networkii - Network Monitor')
+    parser.add_argument('--setup-mode', action='store_true', help='Start directly in setup mode')
+    args = parser.parse_args()
+
+    # Create and run the application
+    app = NetworkiiApp()
+    app.run(setup_mode=args.setup_mode)
+
+if __name__ == "__main__":
+    main()
+    
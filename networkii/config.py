@@ -1,22 +1,33 @@
+from types import MappingProxyType
+
 # User configurable defaults
 # These values can be changed through the web interface
-USER_DEFAULTS = {
+# Read-only view so the defaults can't be mutated at runtime
+USER_DEFAULTS = MappingProxyType({
     'ping_target': '1.1.1.1',
     'speed_test_interval': 30  # minutes
-}
+})
 
 # Display settings
 TOTAL_SCREENS = 4  # Now includes: Home, Basic Stats, Basic, and Detailed
 DEFAULT_SCREEN = 1
 SCREEN_WIDTH = 320
 SCREEN_HEIGHT = 240
+REDRAW_INTERVAL = 1.0  # seconds between setup screen refreshes
+FORCE_REDRAW_INTERVAL = 30  # seconds before an unchanged screen is redrawn anyway
 
 # Network settings
 DEFAULT_HISTORY_LENGTH = 300
 RECENT_HISTORY_LENGTH = 20  # Number of samples for health calculation
+WIFI_CHECK_INTERVAL = 30  # seconds between WiFi connection probes
+INTERNET_CHECK_INTERVAL = 10  # seconds between internet connectivity probes
+BAD_RESPONSES_THRESHOLD = 3  # consecutive failed probes before showing no internet
+GOOD_RESPONSES_THRESHOLD = 2  # consecutive good probes before leaving no internet
+NETWORK_CHANGED_DELAY = 3  # minimum seconds between internet state changes
 
 # Button settings
 DEBOUNCE_TIME = 0.3  # seconds
+BUTTON_BOUNCE_TIME = 20  # milliseconds of contact bounce filtered by the GPIO library
 
 # Font sizes
 FONT_XS = 10   # Extra small for tiny details
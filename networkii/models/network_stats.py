@@ -1,8 +1,11 @@
-from dataclasses import dataclass
-from collections import deque
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 
+# Score for a value within each of a metric's bounds, then for anything past the threshold
+METRIC_SCORES = (100, 75, 50, 25, 0)
+
 class NetworkMetric:
     def __init__(self, name: str, weight: float, threshold: float, excellent: float, good: float, fair: float):
         self.name = name
@@ -11,6 +14,7 @@ class NetworkMetric:
         self.excellent = excellent
         self.good = good
         self.fair = fair
+        self.bounds = (excellent, good, fair, threshold)  # Ascending upper bounds of each score band
 
 class NetworkMetrics:
     # Define network metrics with their weights and thresholds
@@ -21,16 +25,7 @@ class NetworkMetrics:
     @staticmethod
     def calculate_metric_score(value: float, metric: NetworkMetric) -> float:
         """Calculate a score (0-100) for a metric value."""
-        if value <= metric.excellent:
-            return 100
-        elif value <= metric.good:
-            return 75
-        elif value <= metric.fair:
-            return 50
-        elif value <= metric.threshold:
-            return 25
-        else:
-            return 0
+        return METRIC_SCORES[bisect_left(metric.bounds, value)]
 
     @staticmethod
     def get_health_threshold(metric_type: str) -> float:
@@ -44,14 +39,19 @@ class NetworkMetrics:
         else:
             raise ValueError(f"Unknown metric type: {metric_type}")
 
-@dataclass
+@dataclass(frozen=True)
 class NetworkStats:
-    timestamp: float
-    ping_history: deque
-    jitter_history: deque
-    packet_loss_history: deque
+    timestamp: float = field(compare=False)  # Excluded so identical readings compare equal
+    # Immutable snapshots of the monitor's histories, safe to read from other threads
+    ping_history: tuple
+    jitter_history: tuple
+    packet_loss_history: tuple
+    # Mean score (0-100) of each metric's recent samples, None before the first sample
+    ping_score: Optional[float]
+    jitter_score: Optional[float]
+    packet_loss_score: Optional[float]
     speed_test_status: bool
-    speed_test_timestamp: float
+    speed_test_timestamp: float  # time.monotonic() of the last completed test, 0 if none
     download_speed: float
     upload_speed: float
     interface: str
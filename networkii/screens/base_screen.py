@@ -1,12 +1,29 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from PIL import Image, ImageDraw
 from ..models.network_stats import NetworkStats
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..services.screen_manager import ScreenManager
 from ..utils.logger import get_logger
 
 logger = get_logger('screen')
 
+# Button label -> ScreenManager action shared by the stats screens
+NAVIGATION_ACTIONS = {
+    'B': ScreenManager.previous_screen,
+    'Y': ScreenManager.next_screen,
+}
+
+@lru_cache(maxsize=512)
+def text_width(font, text: str) -> int:
+    """Width of text drawn in font, cached as the same short strings are centered every frame."""
+    left, _, right, _ = font.getbbox(text)
+    return right - left
+
 class BaseScreen(ABC):
+    # Button label -> ScreenManager action, looked up per press instead of an if/elif chain
+    button_actions = {}
+
     def __init__(self, display):
         """Initialize with display instance for access to shared resources."""
         self.display = display
@@ -24,6 +41,7 @@ class BaseScreen(ABC):
         # Quick access to images
         self.face_images = display.face_images
         self.heart_image = display.heart_image
+        self.heart_image_dim = display.heart_image_dim
         
         # Screen manager will be set after initialization
         self.screen_manager = None
@@ -38,14 +56,22 @@ class BaseScreen(ABC):
         pass
     
     def handle_button(self, button_label: str):
-        """Handle button press events. Override in screens that need button interaction."""
-        pass
+        """Handle button press events via button_actions. Override for anything beyond navigation."""
+        action = self.button_actions.get(button_label)
+        if action is not None:
+            action(self.screen_manager)
     
     def clear_screen(self):
         """Clear the screen with black background."""
-        self.draw.rectangle((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), fill=(0, 0, 0))
+        self.image.paste((0, 0, 0), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))  # Plain fill, no draw setup
     
     def update_display(self):
         """Update the physical display."""
+        # Redrawn frames often come out identical, e.g. when new samples round to the same values;
+        # comparing the buffer is far cheaper than converting and sending it over SPI again
+        frame = self.image.tobytes()
+        if frame == self.display.last_frame:
+            return
         self.disp.st7789.set_window()
-        self.disp.st7789.display(self.image)
\ No newline at end of file
+        self.disp.st7789.display(self.image)
+        self.display.last_frame = frame  # Only once the panel actually has it
\ No newline at end of file
@@ -1,9 +1,15 @@
 from PIL import Image
-from .base_screen import BaseScreen
+from .base_screen import BaseScreen, NAVIGATION_ACTIONS, text_width
 from ..models.network_stats import NetworkStats
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS
 
 class BasicStatsScreen(BaseScreen):
+    button_actions = NAVIGATION_ACTIONS
+
+    def __init__(self, display):
+        super().__init__(display)
+        self.faces = {}  # Health state -> face resized to fit a grid cell, built on first use
+
     def draw_screen(self, stats: NetworkStats):
         """Show current network statistics with large text in a 2x2 grid."""
         self.clear_screen()
@@ -18,7 +24,10 @@ class BasicStatsScreen(BaseScreen):
         
         # Draw face in top-left
         face_size = min(GRID_WIDTH - GRID_MARGIN * 2, GRID_HEIGHT - GRID_MARGIN * 2)
-        face = self.face_images[health_state].resize((face_size, face_size), Image.Resampling.LANCZOS)
+        face = self.faces.get(health_state)
+        if face is None:
+            face = self.face_images[health_state].resize((face_size, face_size), Image.Resampling.LANCZOS)
+            self.faces[health_state] = face
         face_x = (GRID_WIDTH - face_size) // 2
         face_y = (GRID_HEIGHT - face_size) // 2
         self.image.paste(face, (face_x, face_y), face)
@@ -41,21 +50,10 @@ class BasicStatsScreen(BaseScreen):
         cell_center_y = cell_y + GRID_HEIGHT // 2
         
         # Draw label
-        label_bbox = self.draw.textbbox((0, 0), label, font=self.font_lg)
-        label_width = label_bbox[2] - label_bbox[0]
-        label_x = cell_center_x - label_width // 2
+        label_x = cell_center_x - text_width(self.font_lg, label) // 2
         self.draw.text((label_x, cell_center_y - 30), label, font=self.font_lg, fill=color)
         
         # Draw value
         value_text = str(round(value))
-        value_bbox = self.draw.textbbox((0, 0), value_text, font=self.font_xl)
-        value_width = value_bbox[2] - value_bbox[0]
-        value_x = cell_center_x - value_width // 2
+        value_x = cell_center_x - text_width(self.font_xl, value_text) // 2
         self.draw.text((value_x, cell_center_y + 5), value_text, font=self.font_xl, fill=color)
-    
-    def handle_button(self, button_label):
-        """Handle button presses for basic stats screen."""
-        if button_label == "B":
-            self.screen_manager.previous_screen()
-        elif button_label == "Y":
-            self.screen_manager.next_screen()
\ No newline at end of file
@@ -1,21 +1,37 @@
 import time
-from .base_screen import BaseScreen
+from .base_screen import BaseScreen, NAVIGATION_ACTIONS, text_width
 from ..models.network_stats import NetworkStats
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS
 
+TOP_MARGIN = 10
+ROW_SPACING = 2   
+ROW_HEIGHT = 30
+BOTTOM_Y = SCREEN_HEIGHT - 45  # Divider above the interface info
+
+# (label, color) of each metric row, top to bottom
+METRIC_ROWS = (("PING", 'green'), ("JITTER", 'red'), ("LOSS", 'purple'))
+
 class DetailedStatsScreen(BaseScreen):
+    button_actions = NAVIGATION_ACTIONS
+
+    def __init__(self, display):
+        super().__init__(display)
+        self.background = None  # Labels and divider, which never change, rendered on first draw
+        self.interface_value_x = 0
+        self.target_value_x = 0
+
     def draw_screen(self, stats: NetworkStats):
         """Show detailed network statistics with history."""
-        self.clear_screen()
-        
-        TOP_MARGIN = 10
-        ROW_SPACING = 2   
-        ROW_HEIGHT = 30
+        if self.background is None:
+            self.clear_screen()
+            self.render_background()
+            self.background = self.image.copy()
+        else:
+            self.image.paste(self.background)
         
         # Draw metric rows
         self._draw_metric_row(
             TOP_MARGIN,
-            "PING",
             stats.ping,
             stats.ping_history,
             COLORS['green']
@@ -23,7 +39,6 @@ class DetailedStatsScreen(BaseScreen):
         
         self._draw_metric_row(
             TOP_MARGIN + ROW_HEIGHT + ROW_SPACING,
-            "JITTER",
             stats.jitter,
             stats.jitter_history,
             COLORS['red']
@@ -31,7 +46,6 @@ class DetailedStatsScreen(BaseScreen):
         
         self._draw_metric_row(
             TOP_MARGIN + (ROW_HEIGHT + ROW_SPACING) * 2,
-            "LOSS",
             stats.packet_loss,
             stats.packet_loss_history,
             COLORS['purple']
@@ -44,7 +58,7 @@ class DetailedStatsScreen(BaseScreen):
             self.draw.text((10, speed_y), status_text, font=self.font_sm, fill=COLORS['white'])
             
         elif stats.speed_test_timestamp > 0:
-            time_since_test = (time.time() - stats.speed_test_timestamp) / 60
+            time_since_test = (time.monotonic() - stats.speed_test_timestamp) / 60
             
             down_text = f"↓ {stats.download_speed:.1f} Mbps"
             self.draw.text((10, speed_y), down_text, font=self.font_sm, fill=COLORS['green'])
@@ -53,10 +67,8 @@ class DetailedStatsScreen(BaseScreen):
             self.draw.text((10, speed_y + 30), up_text, font=self.font_sm, fill=COLORS['red'])
             
             time_text = f"Updated {int(time_since_test)}m ago"
-            time_bbox = self.draw.textbbox((0, 0), time_text, font=self.font_xs)
-            time_width = time_bbox[2] - time_bbox[0]
             self.draw.text(
-                (SCREEN_WIDTH - time_width - 10, speed_y + 15),
+                (SCREEN_WIDTH - text_width(self.font_xs, time_text) - 10, speed_y + 15),
                 time_text,
                 font=self.font_xs,
                 fill=COLORS['purple']
@@ -64,41 +76,44 @@ class DetailedStatsScreen(BaseScreen):
         else:
             self.draw.text((10, speed_y), "Speed test pending...", font=self.font_xs, fill=COLORS['white'])
 
+        # Interface and target values next to their labels
+        interface_y = BOTTOM_Y + 5
+        interface_text = f"{stats.interface} ({stats.interface_ip})"
+        self.draw.text((self.interface_value_x, interface_y), interface_text, font=self.font_md, fill=COLORS['white'])
+        self.draw.text((self.target_value_x, interface_y + 20), stats.ping_target, font=self.font_md, fill=COLORS['white'])
+        
+        self.update_display()
+    
+    def render_background(self):
+        """Draw the parts of the screen that never change into the display buffer."""
+        # Metric row labels
+        for row, (label, color) in enumerate(METRIC_ROWS):
+            self.draw.text((10, TOP_MARGIN + (ROW_HEIGHT + ROW_SPACING) * row), label, font=self.font_sm, fill=COLORS[color])
+        
         # Draw interface info at bottom with divider
-        bottom_y = SCREEN_HEIGHT - 45
-        self.draw.line([(10, bottom_y), (SCREEN_WIDTH - 10, bottom_y)], fill=COLORS['gray'], width=1)
+        self.draw.line([(10, BOTTOM_Y), (SCREEN_WIDTH - 10, BOTTOM_Y)], fill=COLORS['gray'], width=1)
         
         # Interface info with colored labels
-        interface_y = bottom_y + 5
+        interface_y = BOTTOM_Y + 5
         self.draw.text((10, interface_y), "Interface:", font=self.font_md, fill=COLORS['purple'])
-        interface_text = f"{stats.interface} ({stats.interface_ip})"
         interface_bbox = self.draw.textbbox((0, 0), "Interface:", font=self.font_md)
-        interface_width = interface_bbox[2] - interface_bbox[0]
-        self.draw.text((20 + interface_width, interface_y), interface_text, font=self.font_md, fill=COLORS['white'])
+        self.interface_value_x = 20 + interface_bbox[2] - interface_bbox[0]
         
         # Target info
         target_y = interface_y + 20
         self.draw.text((10, target_y), "Target:", font=self.font_md, fill=COLORS['green'])
         target_bbox = self.draw.textbbox((0, 0), "Target:", font=self.font_md)
-        target_width = target_bbox[2] - target_bbox[0]
-        self.draw.text((20 + target_width, target_y), stats.ping_target, font=self.font_md, fill=COLORS['white'])
-        
-        self.update_display()
+        self.target_value_x = 20 + target_bbox[2] - target_bbox[0]
     
-    def _draw_metric_row(self, y: int, label: str, current_value: float, history: list, color: tuple):
+    def _draw_metric_row(self, y: int, current_value: float, history: list, color: tuple):
         """Draw metric row with historical values."""
         LABEL_WIDTH = 60  # Reduced to give more space
         CURRENT_WIDTH = 50  # Fixed width for current value
         RIGHT_MARGIN = 5
         
-        # Draw label
-        self.draw.text((10, y), label, font=self.font_sm, fill=color)
-        
-        # Draw current value with larger font
+        # Draw current value with larger font (the label is part of the background)
         current_text = str(round(current_value))
-        current_bbox = self.draw.textbbox((0, 0), current_text, font=self.font_lg)
-        current_width = current_bbox[2] - current_bbox[0]
-        current_x = LABEL_WIDTH + (CURRENT_WIDTH - current_width) // 2
+        current_x = LABEL_WIDTH + (CURRENT_WIDTH - text_width(self.font_lg, current_text)) // 2
         self.draw.text(
             (current_x, y - 5),  # Adjust y position for larger font
             current_text,
@@ -122,12 +137,10 @@ class DetailedStatsScreen(BaseScreen):
             faded_color = tuple(int(c * fade_level) for c in color)
             
             value_text = str(round(value))
-            text_bbox = self.draw.textbbox((0, 0), value_text, font=self.font_md)
-            text_width = text_bbox[2] - text_bbox[0]
             
             # Position each value from left to right
             x_pos = history_start_x + (i * value_spacing)
-            x_pos = x_pos + (value_spacing - text_width) // 2  # Center in available space
+            x_pos = x_pos + (value_spacing - text_width(self.font_md, value_text)) // 2  # Center in available space
             
             self.draw.text(
                 (x_pos, y),
@@ -135,10 +148,3 @@ class DetailedStatsScreen(BaseScreen):
                 font=self.font_md,
                 fill=faded_color
             )
-    
-    def handle_button(self, button_label):
-        """Handle button presses for detailed stats screen."""
-        if button_label == "B":
-            self.screen_manager.previous_screen()
-        elif button_label == "Y":
-            self.screen_manager.next_screen()
\ No newline at end of file
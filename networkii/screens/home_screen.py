@@ -1,4 +1,5 @@
-from .base_screen import BaseScreen, logger
+from PIL import Image
+from .base_screen import BaseScreen, NAVIGATION_ACTIONS, logger, text_width
 from ..models.network_stats import NetworkStats
 from ..config import (SCREEN_WIDTH, SCREEN_HEIGHT, FACE_SIZE, HEART_SIZE, 
                      HEART_SPACING, HEART_GAP, METRIC_WIDTH, METRIC_SPACING,
@@ -6,49 +7,78 @@ from ..config import (SCREEN_WIDTH, SCREEN_HEIGHT, FACE_SIZE, HEART_SIZE,
                      COLORS, METRIC_TOP_MARGIN, METRIC_BOTTOM_MARGIN,
                      HEALTH_THRESHOLDS)
 
+# Health bar color per metric
+BAR_COLORS = {
+    'ping': COLORS['green'],
+    'jitter': COLORS['red'],
+    'packet_loss': COLORS['purple'],
+}
+BAR_SEGMENTS = 20
+
+TOTAL_HEARTS = 5
+HEARTS_WIDTH = (TOTAL_HEARTS * HEART_SIZE) + ((TOTAL_HEARTS - 1) * HEART_GAP)
+
+# Faded shades for the 9 history values under each metric column's current value, oldest dimmest
+FADED_COLORS = {
+    color: tuple(tuple(int(c * (0.8 - (i * 0.08))) for c in color) for i in range(1, 10))
+    for color in BAR_COLORS.values()
+}
+
 class HomeScreen(BaseScreen):
-    def draw_screen(self, stats: NetworkStats):
-        """Draw the home screen with network metrics."""
-        self.clear_screen()
+    button_actions = NAVIGATION_ACTIONS
+
+    def __init__(self, display):
+        super().__init__(display)
+        self.background = None  # Empty health bars, which never change, rendered on first draw
+        # Row of hearts for each number of filled hearts, pasted in one go
+        self.heart_strips = [self.render_heart_strip(filled) for filled in range(TOTAL_HEARTS + 1)]
         
-        # Calculate layout
+        # Layout is fixed, so work it out once
         health_bars_width = BAR_START_X + (BAR_WIDTH * 3) + (BAR_SPACING * 2)
         metrics_width = (3 * (METRIC_WIDTH + METRIC_SPACING)) + METRIC_RIGHT_MARGIN
         remaining_width = SCREEN_WIDTH - health_bars_width - metrics_width
         
-        # Draw metrics columns
         metrics_x = SCREEN_WIDTH - metrics_width
-        self.draw_metric_col(metrics_x, 0, "P", stats.ping_history, COLORS['green'])
-        self.draw_metric_col(metrics_x + METRIC_WIDTH + METRIC_SPACING, 0, "J", stats.jitter_history, COLORS['red'])
-        self.draw_metric_col(metrics_x + (METRIC_WIDTH + METRIC_SPACING) * 2, 0, "L", stats.packet_loss_history, COLORS['purple'])
+        self.metric_col_xs = tuple(metrics_x + (METRIC_WIDTH + METRIC_SPACING) * i for i in range(3))
         
-        # Calculate vertical layout for face and hearts
+        # Vertical layout for message, face and hearts
         message_bbox = self.draw.textbbox((0, 0), "Test", font=self.font_xs)
         message_height = message_bbox[3] - message_bbox[1]
         total_element_height = message_height + 20 + FACE_SIZE + HEART_SPACING + HEART_SIZE
         
-        start_y = (SCREEN_HEIGHT - total_element_height) // 2
-        face_x = health_bars_width + (remaining_width - FACE_SIZE) // 2
+        self.face_x = health_bars_width + (remaining_width - FACE_SIZE) // 2
+        self.message_y = (SCREEN_HEIGHT - total_element_height) // 2
+        self.face_y = self.message_y + message_height + 20
+        self.hearts_x = self.face_x + (FACE_SIZE - HEARTS_WIDTH) // 2
+        self.hearts_y = self.face_y + FACE_SIZE + HEART_SPACING
+
+    def draw_screen(self, stats: NetworkStats):
+        """Draw the home screen with network metrics."""
+        if self.background is None:
+            self.clear_screen()
+            self.render_background()
+            self.background = self.image.copy()
+        else:
+            self.image.paste(self.background)
         
-        message_y = start_y
-        face_y = message_y + message_height + 20
-        hearts_y = face_y + FACE_SIZE + HEART_SPACING
+        # Draw metrics columns
+        ping_x, jitter_x, loss_x = self.metric_col_xs
+        self.draw_metric_col(ping_x, 0, "P", stats.ping_history, COLORS['green'])
+        self.draw_metric_col(jitter_x, 0, "J", stats.jitter_history, COLORS['red'])
+        self.draw_metric_col(loss_x, 0, "L", stats.packet_loss_history, COLORS['purple'])
         
         # Draw health status
-        health_score, health_state = self.display.calculate_network_health(stats)
+        _, health_state = self.display.calculate_network_health(stats)
         message = HEALTH_THRESHOLDS[health_state]['message']
-        message_bbox = self.draw.textbbox((0, 0), message, font=self.font_sm)
-        message_width = message_bbox[2] - message_bbox[0]
-        message_x = face_x + (FACE_SIZE - message_width) // 2
-        self.draw.text((message_x, message_y), message, font=self.font_sm, fill=COLORS['white'])
+        message_x = self.face_x + (FACE_SIZE - text_width(self.font_sm, message)) // 2
+        self.draw.text((message_x, self.message_y), message, font=self.font_sm, fill=COLORS['white'])
         
         # Draw face
-        self.image.paste(self.face_images[health_state], (face_x, face_y), self.face_images[health_state])
+        face = self.face_images[health_state]
+        self.image.paste(face, (self.face_x, self.face_y), face)
         
         # Draw hearts
-        hearts_total_width = (5 * HEART_SIZE) + (4 * HEART_GAP)
-        hearts_x = face_x + (FACE_SIZE - hearts_total_width) // 2
-        self.draw_hearts(hearts_x, hearts_y, health_state)
+        self.draw_hearts(self.hearts_x, self.hearts_y, health_state)
         
         # Draw health bars
         ping_health = self.display.calculate_bar_height(stats.ping_history, 'ping')
@@ -61,16 +91,19 @@ class HomeScreen(BaseScreen):
         
         self.update_display()
     
+    def render_background(self):
+        """Draw the empty health bars into the display buffer."""
+        for i, metric_type in enumerate(('ping', 'jitter', 'packet_loss')):
+            self.draw_health_bar_frame(BAR_START_X + (BAR_WIDTH + BAR_SPACING) * i, 0, BAR_WIDTH, SCREEN_HEIGHT, metric_type)
+    
     def draw_metric_col(self, x: int, y: int, label: str, history: list, color: tuple):
         """Draw metric column with values using full height."""
         if not history:
             return
         
         # Draw label
-        label_bbox = self.draw.textbbox((0, 0), label, font=self.font_sm)
-        label_width = label_bbox[2] - label_bbox[0]
         self.draw.text(
-            (x + (METRIC_WIDTH - label_width) // 2, y + METRIC_TOP_MARGIN),
+            (x + (METRIC_WIDTH - text_width(self.font_sm, label)) // 2, y + METRIC_TOP_MARGIN),
             label,
             font=self.font_sm,
             fill=color
@@ -87,25 +120,20 @@ class HomeScreen(BaseScreen):
         
         # Draw current value
         current_value = str(round(last_values[-1]))
-        current_bbox = self.draw.textbbox((0, 0), current_value, font=self.font_md)
-        current_width = current_bbox[2] - current_bbox[0]
         self.draw.text(
-            (x + (METRIC_WIDTH - current_width) // 2, METRIC_TOP_MARGIN + 20),
+            (x + (METRIC_WIDTH - text_width(self.font_md, current_value)) // 2, METRIC_TOP_MARGIN + 20),
             current_value,
             font=self.font_md,
             fill=color
         )
         
         # Draw history values
+        faded_colors = FADED_COLORS[color]
         for i, value in enumerate(reversed(last_values[:-1]), 1):
-            fade_level = 0.8 - (i * 0.08)
-            faded_color = tuple(int(c * fade_level) for c in color)
+            faded_color = faded_colors[i - 1]
             
             value_text = str(round(value))
-            text_bbox = self.draw.textbbox((0, 0), value_text, font=self.font_sm)
-            text_width = text_bbox[2] - text_bbox[0]
-            
-            text_x = x + (METRIC_WIDTH - text_width) // 2
+            text_x = x + (METRIC_WIDTH - text_width(self.font_sm, value_text)) // 2
             text_y = METRIC_TOP_MARGIN + 30 + (i * value_spacing)
             
             self.draw.text(
@@ -115,30 +143,22 @@ class HomeScreen(BaseScreen):
                 fill=faded_color
             )
     
+    def render_heart_strip(self, filled_hearts: int) -> Image.Image:
+        """Compose a transparent row of hearts, the first filled_hearts of them full and the rest dim."""
+        strip = Image.new('RGBA', (HEARTS_WIDTH, HEART_SIZE), (0, 0, 0, 0))
+        for i in range(TOTAL_HEARTS):
+            heart = self.heart_image if i < filled_hearts else self.heart_image_dim
+            strip.paste(heart, (i * (HEART_SIZE + HEART_GAP), 0))  # Hearts don't overlap, so copy them as-is
+        return strip
+    
     def draw_hearts(self, x: int, y: int, health_state: str):
         """Draw hearts based on network state."""
-        total_hearts = 5
-        filled_hearts = HEALTH_THRESHOLDS[health_state]['hearts']
-        
-        for i in range(total_hearts):
-            heart_x = x + (i * (HEART_SIZE + HEART_GAP))
-            if i < filled_hearts:
-                self.image.paste(self.heart_image, (heart_x, y), self.heart_image)
-            else:
-                heart_outline = self.heart_image.copy()
-                heart_outline.putalpha(50)
-                self.image.paste(heart_outline, (heart_x, y), heart_outline)
+        strip = self.heart_strips[HEALTH_THRESHOLDS[health_state]['hearts']]
+        self.image.paste(strip, (x, y), strip)
     
-    def draw_health_bar(self, x: int, y: int, width: int, height: int, health: float, metric_type: str):
-        """Draw a retro-style health bar."""
-        if metric_type == 'ping':
-            color = COLORS['green']
-        elif metric_type == 'jitter':
-            color = COLORS['red']
-        else:  # packet_loss
-            color = COLORS['purple']
-            
-        dim_color = tuple(max(0, c // 3) for c in color)
+    def draw_health_bar_frame(self, x: int, y: int, width: int, height: int, metric_type: str):
+        """Draw a retro-style health bar's border and dim, empty segments."""
+        dim_color = tuple(max(0, c // 3) for c in BAR_COLORS[metric_type])
         
         # Draw border
         self.draw.rectangle(
@@ -147,13 +167,9 @@ class HomeScreen(BaseScreen):
             width=1
         )
         
-        # Draw segments
-        total_segments = 20
-        segment_height = height // total_segments
-        filled_segments = round(health * total_segments)
-        
         # Draw dim background
-        for i in range(total_segments):
+        segment_height = height // BAR_SEGMENTS
+        for i in range(BAR_SEGMENTS):
             segment_y = y + height - ((i + 1) * segment_height)
             self.draw.rectangle(
                 (x, segment_y, x + width, segment_y + segment_height - 1),
@@ -164,13 +180,18 @@ class HomeScreen(BaseScreen):
                 fill=(0, 0, 0),
                 width=1
             )
+    
+    def draw_health_bar(self, x: int, y: int, width: int, height: int, health: float, metric_type: str):
+        """Fill a health bar drawn by draw_health_bar_frame up to the given health."""
+        segment_height = height // BAR_SEGMENTS
+        filled_segments = round(health * BAR_SEGMENTS)
         
         # Draw filled segments
         if filled_segments > 0:
             fill_height = filled_segments * segment_height
             self.draw.rectangle(
                 (x, y + height - fill_height, x + width, y + height),
-                fill=color
+                fill=BAR_COLORS[metric_type]
             )
             
             for i in range(filled_segments):
@@ -180,10 +201,3 @@ class HomeScreen(BaseScreen):
                     fill=(0, 0, 0),
                     width=1
                 )
-
-    def handle_button(self, button_label):
-        """Handle button presses for home screen."""        
-        if button_label == "B":
-            self.screen_manager.previous_screen()
-        elif button_label == "Y":
-            self.screen_manager.next_screen()
\ No newline at end of file
@@ -1,11 +1,24 @@
 from PIL import Image
-from .base_screen import BaseScreen
+from .base_screen import BaseScreen, logger
 from ..models.network_stats import NetworkStats
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, FACE_SIZE, COLORS
 
 class NoInternetScreen(BaseScreen):
+    def __init__(self, display):
+        super().__init__(display)
+        self.frame = None  # The screen never changes, so it is rendered once and reused
+    
     def draw_screen(self, stats: NetworkStats = None):
         """Show the no internet screen."""
+        if self.frame is None:
+            self.render_frame()
+            self.frame = self.image.copy()
+        else:
+            self.image.paste(self.frame)
+        self.update_display()
+    
+    def render_frame(self):
+        """Draw the no internet screen into the display buffer."""
         self.clear_screen()
         
         # Draw title
@@ -46,10 +59,8 @@ class NoInternetScreen(BaseScreen):
         networkii_x = (SCREEN_WIDTH - networkii_width) // 2
         networkii_y = ssh_y + 20
         self.draw.text((networkii_x, networkii_y), networkii_command, font=self.font_sm, fill=COLORS['green'])
-        
-        self.update_display()
     
     def handle_button(self, button_label):
         if button_label == "B":
             # Button B in no internet mode: Reset WiFi
-            print("NoInternetScreen: Button B pressed - Reset WiFi") 
\ No newline at end of file
+            logger.debug("NoInternetScreen: Button B pressed - Reset WiFi") 
\ No newline at end of file
@@ -7,12 +7,29 @@ from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, FACE_SIZE, COLORS
 class SetupScreen(BaseScreen):
     def __init__(self, display):
         super().__init__(display)
-        self.last_face_change = time.time()
+        self.last_face_change = time.monotonic()
         self.face_types = ['excellent', 'good', 'fair', 'poor', 'critical']
         self.current_face_index = 0
+        self.frames = {}  # Face index -> rendered frame, as only the face ever changes
         
     def draw_screen(self, stats: NetworkStats = None):
         """Show the setup screen with simple instructions."""
+        # Check if it's time to change face
+        current_time = time.monotonic()
+        if current_time - self.last_face_change >= 1.0:  # Change face every second
+            self.current_face_index = (self.current_face_index + 1) % len(self.face_types)
+            self.last_face_change = current_time
+        
+        frame = self.frames.get(self.current_face_index)
+        if frame is None:
+            self.render_frame(self.face_types[self.current_face_index])
+            self.frames[self.current_face_index] = self.image.copy()
+        else:
+            self.image.paste(frame)
+        self.update_display()
+    
+    def render_frame(self, face_type: str):
+        """Draw the setup screen with the given face into the display buffer."""
         self.clear_screen()
         
         # Draw welcome message
@@ -23,14 +40,7 @@ class SetupScreen(BaseScreen):
         message_y = 20
         self.draw.text((message_x, message_y), message, font=self.font_lg, fill=COLORS['white'])
         
-        # Check if it's time to change face
-        current_time = time.time()
-        if current_time - self.last_face_change >= 1.0:  # Change face every second
-            self.current_face_index = (self.current_face_index + 1) % len(self.face_types)
-            self.last_face_change = current_time
-        
         # Draw current face (centered, 75% of original size)
-        face_type = self.face_types[self.current_face_index]
         face = self.face_images[face_type]
         face_size = int(FACE_SIZE * 0.75)  # Make face 75% of original size
         resized_face = face.resize((face_size, face_size), Image.Resampling.LANCZOS)
@@ -72,8 +82,6 @@ class SetupScreen(BaseScreen):
             font=self.font_lg,
             fill=COLORS['green']
         )
-        
-        self.update_display()
     
     def handle_button(self, button_label):
         # Setup screen might not need button handling
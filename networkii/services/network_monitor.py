@@ -1,30 +1,79 @@
 import time
+import math
 import subprocess
-import statistics
+import re
 import speedtest
 import threading
 from collections import deque
-from ..models.network_stats import NetworkStats
+from ..models.network_stats import NetworkStats, NetworkMetrics
 from ..utils.interface import get_preferred_interface, get_interface_ip
 from ..utils.config_manager import config_manager
-from ..config import DEFAULT_HISTORY_LENGTH
+from ..config import DEFAULT_HISTORY_LENGTH, RECENT_HISTORY_LENGTH
 from ..utils.logger import get_logger
 
 # Get logger for this module
 logger = get_logger('monitor')
 
+# Fields of the summary `ping -q` prints, e.g. "5 received" and "rtt min/avg/max/mdev = 9.8/10.2/10.9/0.4 ms"
+_RECEIVED_RE = re.compile(r'(\d+) received')
+_RTT_RE = re.compile(r'= [\d.]+/([\d.]+)/[\d.]+/([\d.]+) ms')
+
+class ScoreWindow:
+    """Scores of a metric's most recent samples, each scored once on arrival, with a running total"""
+    __slots__ = ('metric', 'scores', 'total')
+
+    def __init__(self, metric):
+        self.metric = metric
+        self.scores = deque(maxlen=RECENT_HISTORY_LENGTH)
+        self.total = 0
+
+    def append(self, value: float):
+        score = NetworkMetrics.calculate_metric_score(value, self.metric)
+        if len(self.scores) == self.scores.maxlen:
+            self.total -= self.scores[0]  # About to be evicted by the append
+        self.scores.append(score)
+        self.total += score
+
+    def clear(self):
+        self.scores.clear()
+        self.total = 0
+
+    def mean(self):
+        """Mean recent score (0-100), or None before the first sample"""
+        return self.total / len(self.scores) if self.scores else None
+
 class NetworkMonitor:
+    __slots__ = ('interface', 'interface_ip', 'ping_history', 'jitter_history', 'packet_loss_history',
+                 'last_speed_test', 'download_speed', 'upload_speed', 'is_speed_testing', 'speed_test_thread',
+                 'speedtest_client', 'session', 'ping_scores', 'jitter_scores', 'packet_loss_scores')
+
     def __init__(self):
-        self.interface = get_preferred_interface()
-        self.interface_ip = get_interface_ip(self.interface)
         self.ping_history = deque(maxlen=DEFAULT_HISTORY_LENGTH)
         self.jitter_history = deque(maxlen=DEFAULT_HISTORY_LENGTH)
         self.packet_loss_history = deque(maxlen=DEFAULT_HISTORY_LENGTH)
+        self.ping_scores = ScoreWindow(NetworkMetrics.PING)
+        self.jitter_scores = ScoreWindow(NetworkMetrics.JITTER)
+        self.packet_loss_scores = ScoreWindow(NetworkMetrics.PACKET_LOSS)
+        self.is_speed_testing = False
+        self.speed_test_thread = None
+        self.session = 0
+        self.reset()
+    
+    def reset(self):
+        """Start a new monitoring session: re-detect the interface and drop the previous session's results"""
+        self.session += 1  # A speed test still running from the old session discards its results
+        self.interface = get_preferred_interface()
+        self.interface_ip = get_interface_ip(self.interface)
+        self.ping_history.clear()
+        self.jitter_history.clear()
+        self.packet_loss_history.clear()
+        self.ping_scores.clear()
+        self.jitter_scores.clear()
+        self.packet_loss_scores.clear()
         self.last_speed_test = 0
         self.download_speed = 0
         self.upload_speed = 0
-        self.is_speed_testing = False
-        self.speed_test_thread = None
+        self.speedtest_client = None  # Picked again for the new session's interface and network
 
         logger.info(f"Using interface: {self.interface} ({self.interface_ip}), target host: {config_manager.get_setting('ping_target')}")
     
@@ -35,21 +84,32 @@ class NetworkMonitor:
             
         def speed_test_worker():
             self.is_speed_testing = True
+            session = self.session
             try:
                 if not self.interface_ip:
                     raise Exception("No valid IP address for interface")
                 
-                st = speedtest.Speedtest(secure=True)
-                st.get_config()
-                st.get_best_server()
+                # Server discovery is done once per session; later tests reuse the client
+                st = self.speedtest_client
+                if st is None:
+                    st = speedtest.Speedtest(secure=True)  # Fetches the client config itself
+                    st.get_best_server()
                 
-                self.download_speed = st.download() / 1_000_000
-                self.upload_speed = st.upload() / 1_000_000
+                download_speed = st.download() / 1_000_000
+                upload_speed = st.upload() / 1_000_000
                 
-                self.last_speed_test = time.time()
+                if session != self.session:
+                    logger.info("Discarding speed test results from a previous monitor session")
+                    return
+                self.speedtest_client = st
+                self.download_speed = download_speed
+                self.upload_speed = upload_speed
+                self.last_speed_test = time.monotonic()
                 logger.info(f"Speed test completed - Down: {self.download_speed:.1f} Mbps, Up: {self.upload_speed:.1f} Mbps")
             except Exception as e:
                 logger.error(f"Speed test failed: {e}")
+                if session == self.session:
+                    self.speedtest_client = None  # Start from fresh discovery next time
             finally:
                 self.is_speed_testing = False
 
@@ -59,46 +119,55 @@ class NetworkMonitor:
 
     def get_stats(self, count=5, ping_interval=0.2) -> NetworkStats:
         """Get current network statistics"""
-        ping_target = config_manager.get_setting('ping_target')
+        config = config_manager.snapshot()  # One config check per sample
+        ping_target = config['ping_target']
         
         # Run ping test
         packet_loss = 0
         
         try:
-            speed_test_interval = config_manager.get_setting('speed_test_interval') * 60  # Convert minutes to seconds
-            if time.time() - self.last_speed_test > speed_test_interval and not self.is_speed_testing:
+            speed_test_interval = config['speed_test_interval'] * 60  # Convert minutes to seconds
+            # last_speed_test is 0 until the first test completes, so it runs straight away
+            due = not self.last_speed_test or time.monotonic() - self.last_speed_test > speed_test_interval
+            if due and not self.is_speed_testing:
                 self.run_speed_test()
             
-            cmd = ['ping', ping_target, '-c', str(count), '-i', str(ping_interval), '-I', self.interface]
+            # -n skips reverse DNS, -q prints only the summary, -W bounds the wait for late replies
+            cmd = ['ping', '-n', '-q', ping_target, '-c', str(count), '-i', str(ping_interval), '-W', '1', '-I', self.interface]
             result = subprocess.run(cmd, capture_output=True, text=True)
             
-            times = []
-            packets_received = 0
-            
-            for line in result.stdout.splitlines():
-                if 'time=' in line:
-                    time_str = line.split('time=')[1].split()[0]
-                    times.append(float(time_str))
-                    packets_received += 1
-            
-            avg_ping = statistics.mean(times) if times else 0
-            jitter = statistics.stdev(times) if len(times) > 1 else 0
+            # ping has already averaged the replies and worked out their standard deviation (mdev)
+            received = _RECEIVED_RE.search(result.stdout)
+            packets_received = int(received.group(1)) if received else 0
+            rtt = _RTT_RE.search(result.stdout)  # Missing when no replies came back
+            avg_ping = float(rtt.group(1)) if rtt else 0
+            # mdev is the population form; scale it to the sample stdev jitter has always been
+            if rtt and packets_received > 1:
+                jitter = float(rtt.group(2)) * math.sqrt(packets_received / (packets_received - 1))
+            else:
+                jitter = 0
             packet_loss = ((count - packets_received) / count) * 100
             
             if avg_ping > 0:
                 self.ping_history.append(avg_ping)
+                self.ping_scores.append(avg_ping)
             if jitter >= 0:
                 self.jitter_history.append(jitter)
+                self.jitter_scores.append(jitter)
             self.packet_loss_history.append(packet_loss)
+            self.packet_loss_scores.append(packet_loss)
             
         except Exception as e:
-            logger.error(f"Error during ping: {e}")
+            logger.error("Error during ping: %s", e)
 
         return NetworkStats(
             timestamp=time.time(),
-            ping_history=self.ping_history,
-            jitter_history=self.jitter_history,
-            packet_loss_history=self.packet_loss_history,
+            ping_history=tuple(self.ping_history),
+            jitter_history=tuple(self.jitter_history),
+            packet_loss_history=tuple(self.packet_loss_history),
+            ping_score=self.ping_scores.mean(),
+            jitter_score=self.jitter_scores.mean(),
+            packet_loss_score=self.packet_loss_scores.mean(),
             speed_test_status=self.is_speed_testing,
             speed_test_timestamp=self.last_speed_test,
             download_speed=self.download_speed,
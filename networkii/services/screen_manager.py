@@ -3,54 +3,59 @@ from ..utils.logger import get_logger
 logger = get_logger('screen_manager')
 
 class ScreenManager:
+    __slots__ = ('screens', 'current_screen', 'screen_order', '_next_of', '_prev_of', '_active')
+
     def __init__(self):
         self.screens = {}
         self.current_screen = None
+        self._active = None  # Screen object for current_screen, resolved on switch rather than per frame
         self.screen_order = ['home', 'basic_stats', 'detailed_stats']  # Define screen navigation order
         
+        # Precomputed neighbours so navigation is a single dict lookup
+        count = len(self.screen_order)
+        self._next_of = {name: self.screen_order[(i + 1) % count] for i, name in enumerate(self.screen_order)}
+        self._prev_of = {name: self.screen_order[(i - 1) % count] for i, name in enumerate(self.screen_order)}
+        
     def add_screen(self, name: str, screen):
         """Add a screen to the manager."""
         self.screens[name] = screen
         screen.set_screen_manager(self)  # Set screen manager reference
         if self.current_screen is None:
-            self.current_screen = name
+            self._set_current(name)
+    
+    def _set_current(self, name: str):
+        """Make name the current screen and cache its screen object."""
+        self.current_screen = name
+        self._active = self.screens[name]
     
     def switch_screen(self, name: str):
         """Switch to a different screen."""
         if name not in self.screens:
             raise ValueError(f"Screen {name} not found")
-        self.current_screen = name
+        self._set_current(name)
     
     def next_screen(self):
         """Switch to the next screen in order."""
-        if self.current_screen is None or self.current_screen not in self.screen_order:
-            self.current_screen = self.screen_order[0]
-            return
-            
-        current_index = self.screen_order.index(self.current_screen)
-        next_index = (current_index + 1) % len(self.screen_order)
-        self.current_screen = self.screen_order[next_index]
+        # Screens outside the navigation order (or none) start from the first screen
+        self._set_current(self._next_of.get(self.current_screen, self.screen_order[0]))
     
     def previous_screen(self):
         """Switch to the previous screen in order."""
-        if self.current_screen is None or self.current_screen not in self.screen_order:
-            self.current_screen = self.screen_order[-1]
-            return
-            
-        current_index = self.screen_order.index(self.current_screen)
-        prev_index = (current_index - 1) % len(self.screen_order)
-        self.current_screen = self.screen_order[prev_index]
+        # Screens outside the navigation order (or none) start from the last screen
+        self._set_current(self._prev_of.get(self.current_screen, self.screen_order[-1]))
     
     def draw_screen(self, stats):
         """Draw the current screen."""
-        if self.current_screen is None:
+        screen = self._active
+        if screen is None:
             return
-        self.screens[self.current_screen].draw_screen(stats)
+        screen.draw_screen(stats)
     
     def handle_button(self, button_label: str):
         """Handle button press on current screen."""
-        if self.current_screen is None:
+        screen = self._active
+        if screen is None:
             return
         
-        logger.debug(f"Button {button_label} pressed on {self.current_screen} screen")
-        self.screens[self.current_screen].handle_button(button_label)
\ No newline at end of file
+        logger.debug("Button %s pressed on %s screen", button_label, self.current_screen)
+        screen.handle_button(button_label)
\ No newline at end of file
@@ -0,0 +1,22 @@
+import time
+
+class TTLCached:
+    """Wrap a zero-argument function and only re-run it once its result is older than ttl seconds"""
+    __slots__ = ('fn', 'ttl', 'timestamp', 'value')
+
+    def __init__(self, fn, ttl):
+        self.fn = fn
+        self.ttl = ttl
+        self.timestamp = None  # time.monotonic() of the last call, None forces a call
+        self.value = None
+
+    def __call__(self):
+        now = time.monotonic()
+        if self.timestamp is None or now - self.timestamp > self.ttl:
+            self.value = self.fn()
+            self.timestamp = now
+        return self.value
+
+    def invalidate(self):
+        """Force the next call to re-run the function"""
+        self.timestamp = None
@@ -1,61 +1,120 @@
 import os
-import json
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from networkii.config import USER_DEFAULTS
 from networkii.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+    import json
+
 # Get logger for this module
 logger = get_logger('config_manager')
 
+def _loads(data: bytes) -> dict:
+    """Decode the raw config file contents"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(config: dict) -> bytes:
+    """Encode the config for writing in a single call"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
 class ConfigManager:
     CONFIG_DIR = Path.home() / '.networkii'
     CONFIG_FILE = CONFIG_DIR / 'config.json'
+    __slots__ = ('config_file', 'last_mtime', 'lock', 'config')
 
     def __init__(self):
         logger.info("============ Initializing ConfigManager =============")
-        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        if not self.CONFIG_DIR.is_dir():
+            self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         self.config_file = str(self.CONFIG_FILE)
         self.last_mtime = 0
-        self.config = USER_DEFAULTS.copy()  # Initialize with defaults first
+        self.lock = threading.Lock()  # Guards swaps of self.config only, never I/O
+        # Writers replace self.config wholesale and never mutate it in place, so
+        # readers can use whatever dict the attribute points at without the lock
+        self.config = dict(USER_DEFAULTS)  # Initialize with defaults first
         logger.info(f"Using config file: {self.config_file}")
         self.load_config()  # Then load from file if it exists
 
     def _check_for_updates(self):
         """Check if config file has been modified"""
         try:
-            if os.path.exists(self.config_file):
-                mtime = os.path.getmtime(self.config_file)
-                if mtime > self.last_mtime:
-                    logger.debug("Config change detected, reloading from file")
-                    self.load_config()
-                    self.last_mtime = mtime
+            mtime = os.stat(self.config_file).st_mtime
+        except FileNotFoundError:
+            return False
         except Exception as e:
-            logger.error(f"Error checking for updates: {e}")
+            logger.error("Error checking for updates: %s", e)
+            return False
+
+        if mtime <= self.last_mtime:
+            return False
+
+        logger.debug("Config change detected, reloading from file")
+        self._load_from_disk(mtime)
+        return True
     
     def load_config(self):
         """Load configuration from file"""
         try:
-            if os.path.exists(self.config_file):
-                logger.info(f"Reading config from: {self.config_file}")
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Update config with loaded values while preserving defaults
-                    self.config.update(loaded_config)
-                    logger.info(f"Loaded configuration: {self.config}")
-            else:
-                logger.info(f"No config file found at {self.config_file}, creating with defaults")
-                self.save_config()
+            mtime = os.stat(self.config_file).st_mtime
+        except FileNotFoundError:
+            logger.info(f"No config file found at {self.config_file}, creating with defaults")
+            self.save_config()
+            return
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
+            return
+        self._load_from_disk(mtime)
+
+    def _parse_file(self):
+        """Read and decode the config file"""
+        logger.debug("Reading config from: %s", self.config_file)
+        with open(self.config_file, 'rb') as f:
+            return _loads(f.read())
+
+    def _load_from_disk(self, mtime):
+        """Read the config file whose mtime the caller has already stat'ed"""
+        try:
+            new_config = USER_DEFAULTS | self._parse_file()
+        except Exception as e:
+            logger.error(f"Error loading configuration: {e}")
+            return []
+
+        with self.lock:
+            if mtime <= self.last_mtime:  # Another thread already loaded this version
+                return []
+            # Single pass over the file's keys, then swap the whole dict in
+            changed = [(key, value) for key, value in new_config.items() if self.config.get(key) != value]
+            self.config = new_config
+            self.last_mtime = mtime
+
+        if changed:
+            logger.info(f"Loaded configuration, changed: {dict(changed)}")
+        return changed
     
-    def save_config(self):
+    def save_config(self, config=None):
         """Save current configuration to file"""
+        if config is None:
+            config = self.config
         try:
-            logger.info(f"Saving config to: {self.config_file}")
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
-                logger.info("Configuration saved successfully")
-            self.last_mtime = os.path.getmtime(self.config_file)
+            logger.debug("Saving config to: %s", self.config_file)
+            # Write a temp file and rename it over the config so readers never see a torn file
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self.last_mtime = os.stat(self.config_file).st_mtime
+            logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
     
@@ -64,16 +123,25 @@ class ConfigManager:
         self._check_for_updates()  # Check for changes before returning
         return self.config.copy()
     
+    def snapshot(self):
+        """Get a read-only view of the configuration after a single update check, for reading several settings at once"""
+        self._check_for_updates()
+        return MappingProxyType(self.config)  # Never mutated in place, so the view stays consistent
+    
     def update_config(self, new_config):
         """Update configuration with new values"""
-        self.config.update(new_config)
-        self.save_config()
-        logger.info(f"Configuration updated: {self.config}")
+        with self.lock:
+            self.config = {**self.config, **new_config}
+            snapshot = self.config
+        # Disk I/O runs without holding the lock
+        self.save_config(snapshot)
+        logger.info(f"Configuration updated: {snapshot}")
     
     def get_setting(self, key):
         """Get a configuration setting by key, falling back to default if not found"""
         self._check_for_updates()  # Check for changes before returning
-        return self.config.get(key, USER_DEFAULTS.get(key))
+        config = self.config  # Lock-free read of the current snapshot
+        return config[key] if key in config else USER_DEFAULTS.get(key)
 
 # Create a singleton instance
-config_manager = ConfigManager() 
\ No newline at end of file
+config_manager = ConfigManager() 
@@ -1,5 +1,8 @@
 import netifaces
 from typing import Optional
+from .logger import get_logger
+
+logger = get_logger('interface')
 
 def get_preferred_interface() -> str:
     """Get the preferred network interface (usb0 with ICS standard IPv4 if available, otherwise wlan0)"""
@@ -21,5 +24,5 @@ def get_interface_ip(interface_name: str) -> Optional[str]:
         if netifaces.AF_INET in addrs:
             return addrs[netifaces.AF_INET][0]['addr']
     except Exception as e:
-        print(f"Error getting IP for interface {interface_name}: {e}")
+        logger.error(f"Error getting IP for interface {interface_name}: {e}")
     return None 
\ No newline at end of file
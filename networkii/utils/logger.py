@@ -2,18 +2,20 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-def get_logger(name):
-    """Get a logger instance with the specified name."""
-    logger = logging.getLogger(name)
-    
-    if not logger.handlers:  # Only add handler if it doesn't have one
-        logger.setLevel(logging.DEBUG)
-        
+_handlers = None
+
+def _get_handlers():
+    """Create the file and console handlers once, shared by every logger."""
+    global _handlers
+    if _handlers is None:
         # Create user-specific log directory
         log_dir = Path.home() / '.networkii'
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if not log_dir.is_dir():  # One stat on warm boots instead of a failing mkdir plus a stat
+            log_dir.mkdir(parents=True, exist_ok=True)
         log_file = str(log_dir / 'networkii.log')
-        
+
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
         # Rotating file handler (50MB max size, keep one backup)
         max_bytes = 50 * 1024 * 1024  # 50MB
         file_handler = RotatingFileHandler(
@@ -22,14 +24,23 @@ def get_logger(name):
             backupCount=1  # Keep one backup file
         )
         file_handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
+
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.ERROR)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-    
-    return logger 
\ No newline at end of file
+
+        _handlers = (file_handler, console_handler)
+    return _handlers
+
+def get_logger(name):
+    """Get a logger instance with the specified name."""
+    logger = logging.getLogger(name)
+
+    if not logger.handlers:  # Only add handler if it doesn't have one
+        logger.setLevel(logging.DEBUG)
+        for handler in _get_handlers():
+            logger.addHandler(handler)
+
+    return logger
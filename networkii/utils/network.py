@@ -5,12 +5,19 @@ from .config_manager import config_manager
 
 logger = get_logger('network')
 
+def has_ipv4(interface) -> bool:
+    """Check if interface exists and has an IPv4 address, without logging"""
+    try:
+        return netifaces.AF_INET in netifaces.ifaddresses(interface)
+    except ValueError:  # No such interface
+        return False
+
 def check_connection(interface) -> bool:
     """Check if we have a working network connection on given interface"""
     try:
         addrs = netifaces.ifaddresses(interface)
         if netifaces.AF_INET not in addrs:
-            logger.error(f"No IPv4 address found for interface {interface}")
+            logger.debug("No IPv4 address found for interface %s", interface)
             return False
         
         ping_target = config_manager.get_setting('ping_target')
@@ -21,7 +28,7 @@ def check_connection(interface) -> bool:
         )
         return result.returncode == 0
     except Exception as e:
-        logger.error(f"Error checking connection: {str(e)}")
+        logger.error("Error checking connection: %s", e)
         return False
     
 def has_wifi_saved(interface) -> bool:
@@ -42,14 +49,28 @@ def has_wifi_saved(interface) -> bool:
             if len(parts) >= 3:  # Changed to >= 3 in case there are spaces in connection names
                 device, state, connection = parts[0], parts[1], ' '.join(parts[2:])
                 if device == interface and connection != "Hotspot":
-                    logger.debug(f"Device: {device}, State: {state}, Connection: {connection}")
+                    logger.debug("Device: %s, State: %s, Connection: %s", device, state, connection)
                     return (state.lower() == "connected")
         
         return False  # Only return False after checking all lines
     except Exception as e:
-        logger.error(f"Error checking WiFi connection: {str(e)}")
+        logger.error("Error checking WiFi connection: %s", e)
         return False
 
+def monitor_device(interface):
+    """Start `nmcli device monitor` for interface, which prints a line per device state change.
+    Returns the process, or None if it could not be started"""
+    try:
+        return subprocess.Popen(
+            ['nmcli', 'device', 'monitor', interface],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+    except Exception as e:
+        logger.error(f"Error starting device monitor for {interface}: {str(e)}")
+        return None
+
 def remove_connection(connection_name) -> bool:
     """Remove NetworkManager connection for given interface"""
     try: